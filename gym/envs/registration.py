@@ -138,6 +138,13 @@ class EnvRegistry(object):
         else:
             id = path
 
+        # IDs are validated by EnvSpec on registration, so a registered ID
+        # can be returned without parsing it again.
+        try:
+            return self.env_specs[id]
+        except KeyError:
+            pass
+
         match = env_id_re.search(id)
         if not match:
             raise error.Error(
@@ -146,25 +153,20 @@ class EnvRegistry(object):
                 )
             )
 
-        try:
-            return self.env_specs[id]
-        except KeyError:
-            # Parse the env name and check to see if it matches the non-version
-            # part of a valid env (could also check the exact number here)
-            env_name = match.group(1)
-            matching_envs = [
-                valid_env_name
-                for valid_env_name, valid_env_spec in self.env_specs.items()
-                if env_name == valid_env_spec._env_name
-            ]
-            if matching_envs:
-                raise error.DeprecatedEnv(
-                    "Env {} not found (valid versions include {})".format(
-                        id, matching_envs
-                    )
-                )
-            else:
-                raise error.UnregisteredEnv("No registered env with id: {}".format(id))
+        # Parse the env name and check to see if it matches the non-version
+        # part of a valid env (could also check the exact number here)
+        env_name = match.group(1)
+        matching_envs = [
+            valid_env_name
+            for valid_env_name, valid_env_spec in self.env_specs.items()
+            if env_name == valid_env_spec._env_name
+        ]
+        if matching_envs:
+            raise error.DeprecatedEnv(
+                "Env {} not found (valid versions include {})".format(id, matching_envs)
+            )
+        else:
+            raise error.UnregisteredEnv("No registered env with id: {}".format(id))
 
     def register(self, id, **kwargs):
         if id in self.env_specs:
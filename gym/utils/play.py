@@ -1,4 +1,5 @@
 import gym
+import numpy as np
 import pygame
 import matplotlib
 import argparse
@@ -170,11 +171,17 @@ class PlayPlot(object):
         xmin, xmax = max(0, self.t - self.horizon_timesteps), self.t
 
         for i, plot in enumerate(self.cur_plot):
-            if plot is not None:
-                plot.remove()
-            self.cur_plot[i] = self.ax[i].scatter(
-                range(xmin, xmax), list(self.data[i]), c="blue"
-            )
+            offsets = np.column_stack((np.arange(xmin, xmax), self.data[i]))
+            if plot is None:
+                self.cur_plot[i] = self.ax[i].scatter(
+                    offsets[:, 0], offsets[:, 1], c="blue"
+                )
+            else:
+                # Reuse the existing artist rather than allocating a new one
+                # on every step.
+                plot.set_offsets(offsets)
+                self.ax[i].update_datalim(offsets)
+                self.ax[i].autoscale_view(scalex=False)
             self.ax[i].set_xlim(xmin, xmax)
         plt.pause(0.000001)
 
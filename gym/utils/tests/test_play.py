@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pygame")
+matplotlib = pytest.importorskip("matplotlib")
+
+from gym.utils import play
+
+
+@pytest.fixture
+def agg_pyplot(monkeypatch):
+    matplotlib.use("Agg", force=True)
+    import matplotlib.pyplot as plt
+
+    monkeypatch.setattr(play, "plt", plt)
+    monkeypatch.setattr(plt, "pause", lambda interval: None)
+    yield plt
+    plt.close("all")
+
+
+def test_play_plot_reuses_artists(agg_pyplot):
+    horizon_timesteps = 5
+    plotter = play.PlayPlot(
+        lambda obs_t, obs_tp1, action, rew, done, info: [rew, -rew],
+        horizon_timesteps,
+        ["reward", "negated"],
+    )
+
+    plotter.callback(None, None, 0, 0.0, False, {})
+    artists = list(plotter.cur_plot)
+
+    num_steps = 12
+    for t in range(1, num_steps):
+        plotter.callback(None, None, 0, float(t), False, {})
+
+    xs = np.arange(num_steps - horizon_timesteps, num_steps)
+    ys = xs.astype(float)
+    for axis, artist, sign in zip(plotter.ax, artists, [1, -1]):
+        assert list(axis.collections) == [artist]
+        np.testing.assert_array_equal(
+            artist.get_offsets(), np.column_stack((xs, sign * ys))
+        )
+        assert axis.get_xlim() == (xs[0], num_steps)
+    assert plotter.cur_plot == artists
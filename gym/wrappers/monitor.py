@@ -10,6 +10,11 @@ from gym.wrappers.monitoring import stats_recorder, video_recorder
 from gym.utils import atomic_write, closer
 from gym.utils.json_utils import json_encode_np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 FILE_PREFIX = "openaigym"
 MANIFEST_PREFIX = FILE_PREFIX + ".manifest"
 
@@ -347,23 +352,44 @@ def _open_monitors():
     return list(monitor_closer.closeables.values())
 
 
+def _load_json(path):
+    """Load a monitor JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens and >64-bit integers
+            # that json.dump writes, so let the stdlib parser handle those.
+            pass
+    return json.loads(data)
+
+
 def load_env_info_from_manifests(manifests, training_dir):
     env_infos = []
     for manifest in manifests:
-        with open(manifest) as f:
-            contents = json.load(f)
-            env_infos.append(contents["env_info"])
+        contents = _load_json(manifest)
+        env_infos.append(contents["env_info"])
 
     env_info = collapse_env_infos(env_infos, training_dir)
     return env_info
 
 
 def load_results(training_dir):
-    if not os.path.exists(training_dir):
+    try:
+        # os.fspath keeps the TypeError for None, which os.listdir would
+        # otherwise treat as the current directory.
+        files = os.listdir(os.fspath(training_dir))
+    except (OSError, ValueError):
+        # Only a path that does not exist counts as missing; an existing
+        # but unlistable one still raises, as it did before.
+        if os.path.exists(training_dir):
+            raise
         logger.error("Training directory %s not found", training_dir)
         return
 
-    manifests = detect_training_manifests(training_dir)
+    manifests = detect_training_manifests(training_dir, files)
     if not manifests:
         logger.error("No manifests found in training directory %s", training_dir)
         return
@@ -376,15 +402,14 @@ def load_results(training_dir):
     env_infos = []
 
     for manifest in manifests:
-        with open(manifest) as f:
-            contents = json.load(f)
-            # Make these paths absolute again
-            stats_files.append(os.path.join(training_dir, contents["stats"]))
-            videos += [
-                (os.path.join(training_dir, v), os.path.join(training_dir, m))
-                for v, m in contents["videos"]
-            ]
-            env_infos.append(contents["env_info"])
+        contents = _load_json(manifest)
+        # Make these paths absolute again
+        stats_files.append(os.path.join(training_dir, contents["stats"]))
+        videos += [
+            (os.path.join(training_dir, v), os.path.join(training_dir, m))
+            for v, m in contents["videos"]
+        ]
+        env_infos.append(contents["env_info"])
 
     env_info = collapse_env_infos(env_infos, training_dir)
     (
@@ -420,28 +445,34 @@ def merge_stats_files(stats_files):
     data_sources = []
 
     for i, path in enumerate(stats_files):
-        with open(path) as f:
-            content = json.load(f)
-            if len(content["timestamps"]) == 0:
-                continue  # so empty file doesn't mess up results, due to null initial_reset_timestamp
-            data_sources += [i] * len(content["timestamps"])
-            timestamps += content["timestamps"]
-            episode_lengths += content["episode_lengths"]
-            episode_rewards += content["episode_rewards"]
-            # Recent addition
-            episode_types += content.get("episode_types", [])
-            # Keep track of where each episode came from.
-            initial_reset_timestamps.append(content["initial_reset_timestamp"])
-
-    idxs = np.argsort(timestamps)
-    timestamps = np.array(timestamps)[idxs].tolist()
-    episode_lengths = np.array(episode_lengths)[idxs].tolist()
-    episode_rewards = np.array(episode_rewards)[idxs].tolist()
-    data_sources = np.array(data_sources)[idxs].tolist()
-
-    if episode_types:
-        episode_types = np.array(episode_types)[idxs].tolist()
+        content = _load_json(path)
+        if len(content["timestamps"]) == 0:
+            continue  # so empty file doesn't mess up results, due to null initial_reset_timestamp
+        data_sources += [i] * len(content["timestamps"])
+        timestamps += content["timestamps"]
+        episode_lengths += content["episode_lengths"]
+        episode_rewards += content["episode_rewards"]
+        # Recent addition
+        episode_types += content.get("episode_types", [])
+        # Keep track of where each episode came from.
+        initial_reset_timestamps.append(content["initial_reset_timestamp"])
+
+    timestamps_arr = np.array(timestamps)
+    if (not episode_types or len(episode_types) >= len(timestamps)) and np.all(
+        timestamps_arr[:-1] <= timestamps_arr[1:]
+    ):
+        # Already in order; skips NumPy's int/float promotion of the lists.
+        episode_types = episode_types[: len(timestamps)]
     else:
+        idxs = np.argsort(timestamps_arr)
+        timestamps = timestamps_arr[idxs].tolist()
+        episode_lengths = np.array(episode_lengths)[idxs].tolist()
+        episode_rewards = np.array(episode_rewards)[idxs].tolist()
+        data_sources = np.array(data_sources)[idxs].tolist()
+        if episode_types:
+            episode_types = np.array(episode_types)[idxs].tolist()
+
+    if not episode_types:
         episode_types = None
 
     if len(initial_reset_timestamps) > 0:
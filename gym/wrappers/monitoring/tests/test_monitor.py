@@ -0,0 +1,183 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import gym
+from gym.wrappers import monitor, TransformReward
+from gym.wrappers.monitoring.tests.helpers import tempdir
+
+
+def test_load_results_missing_directory():
+    with tempdir() as temp:
+        assert monitor.load_results(os.path.join(temp, "missing")) is None
+
+
+def test_load_results_path_through_file():
+    with tempdir() as temp:
+        path = os.path.join(temp, "f")
+        open(path, "w").close()
+        assert monitor.load_results(os.path.join(path, "x")) is None
+        with pytest.raises(NotADirectoryError):
+            monitor.load_results(path)
+
+
+def test_load_results_none_directory():
+    with pytest.raises(TypeError):
+        monitor.load_results(None)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_results_roundtrip(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(monitor, "orjson", None)
+
+    with tempdir() as temp:
+        env = TransformReward(gym.make("CartPole-v1"), lambda r: float("inf"))
+        env = monitor.Monitor(env, temp, video_callable=False)
+        env.seed(0)
+        for _ in range(2):
+            env.reset()
+            done = False
+            while not done:
+                _, _, done, _ = env.step(env.action_space.sample())
+        episode_lengths = env.get_episode_lengths()
+        env.close()
+
+        results = monitor.load_results(temp)
+
+    assert results["env_info"]["env_id"] == "CartPole-v1"
+    assert results["episode_lengths"] == episode_lengths
+    assert len(results["episode_rewards"]) == 2
+    assert np.all(np.isinf(results["episode_rewards"]))
+
+
+def write_stats_file(directory, name, timestamps, episode_types=None):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        json.dump(
+            {
+                "initial_reset_timestamp": timestamps[0] - 1 if timestamps else None,
+                "timestamps": timestamps,
+                "episode_lengths": [int(t) for t in timestamps],
+                "episode_rewards": [float(t) / 10 for t in timestamps],
+                "episode_types": episode_types
+                if episode_types is not None
+                else ["t"] * len(timestamps),
+            },
+            f,
+        )
+    return path
+
+
+def test_merge_stats_files_single_file():
+    with tempdir() as temp:
+        path = write_stats_file(temp, "a.stats.json", [1.0, 2.0, 3.0])
+        (
+            data_sources,
+            initial_reset_timestamps,
+            timestamps,
+            episode_lengths,
+            episode_rewards,
+            episode_types,
+            initial_reset_timestamp,
+        ) = monitor.merge_stats_files([path])
+
+    assert data_sources == [0, 0, 0]
+    assert initial_reset_timestamps == [0.0]
+    assert timestamps == [1.0, 2.0, 3.0]
+    assert episode_lengths == [1, 2, 3]
+    assert episode_rewards == [0.1, 0.2, 0.3]
+    assert episode_types == ["t", "t", "t"]
+    assert initial_reset_timestamp == 0.0
+
+
+def test_merge_stats_files_interleaved():
+    with tempdir() as temp:
+        paths = [
+            write_stats_file(temp, "a.stats.json", [1.0, 3.0], ["t", "t"]),
+            write_stats_file(temp, "b.stats.json", [2.0, 4.0], ["e", "e"]),
+        ]
+        (
+            data_sources,
+            initial_reset_timestamps,
+            timestamps,
+            episode_lengths,
+            episode_rewards,
+            episode_types,
+            initial_reset_timestamp,
+        ) = monitor.merge_stats_files(paths)
+
+    assert data_sources == [0, 1, 0, 1]
+    assert initial_reset_timestamps == [0.0, 1.0]
+    assert timestamps == [1.0, 2.0, 3.0, 4.0]
+    assert episode_lengths == [1, 2, 3, 4]
+    assert episode_rewards == [0.1, 0.2, 0.3, 0.4]
+    assert episode_types == ["t", "e", "t", "e"]
+    assert initial_reset_timestamp == 0.0
+
+
+def test_merge_stats_files_empty_file():
+    with tempdir() as temp:
+        paths = [
+            write_stats_file(temp, "a.stats.json", []),
+            write_stats_file(temp, "b.stats.json", [1.0, 2.0]),
+        ]
+        (
+            data_sources,
+            initial_reset_timestamps,
+            timestamps,
+            _,
+            _,
+            episode_types,
+            initial_reset_timestamp,
+        ) = monitor.merge_stats_files(paths)
+
+    assert data_sources == [1, 1]
+    assert initial_reset_timestamps == [0.0]
+    assert timestamps == [1.0, 2.0]
+    assert episode_types == ["t", "t"]
+    assert initial_reset_timestamp == 0.0
+
+    with tempdir() as temp:
+        path = write_stats_file(temp, "a.stats.json", [])
+        results = monitor.merge_stats_files([path])
+
+    assert results[2] == []
+    assert results[5] is None
+    assert results[6] == 0
+
+
+def test_merge_stats_files_episode_in_progress():
+    # The type of an unfinished episode is recorded on reset, before its
+    # timestamp, so episode_types can be one entry longer than timestamps.
+    with tempdir() as temp:
+        path = write_stats_file(temp, "a.stats.json", [1.0, 2.0], ["t", "t", "e"])
+        episode_types = monitor.merge_stats_files([path])[5]
+
+    assert episode_types == ["t", "t"]
+
+
+def test_merge_stats_files_missing_episode_types():
+    # Older stats files have no episode_types, so the merged list cannot be
+    # aligned with the timestamps regardless of file order.
+    with tempdir() as temp:
+        a = os.path.join(temp, "a.stats.json")
+        with open(a, "w") as f:
+            json.dump(
+                {
+                    "initial_reset_timestamp": 0.0,
+                    "timestamps": [1.0, 2.0],
+                    "episode_lengths": [1, 2],
+                    "episode_rewards": [0.1, 0.2],
+                },
+                f,
+            )
+        b = write_stats_file(temp, "b.stats.json", [3.0, 4.0], ["t", "e"])
+
+        for paths in ([a, b], [b, a]):
+            with pytest.raises(IndexError):
+                monitor.merge_stats_files(paths)